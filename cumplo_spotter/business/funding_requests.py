@@ -1,20 +1,11 @@
+from collections.abc import Iterable, Sequence
+from itertools import compress
 from logging import getLogger
 
 from cumplo_common.models import FilterConfiguration, FundingRequest, User
 
 from cumplo_spotter.integrations import cumplo
-from cumplo_spotter.models.filter import (
-    CreditTypeFilter,
-    DicomFilter,
-    MaximumDurationFilter,
-    MinimumAmountFilter,
-    MinimumDurationFilter,
-    MinimumInvestmentFilter,
-    MinimumIRRFilter,
-    MinimumMonthlyProfitFilter,
-    MinimumScoreFilter,
-    PortfolioFilter,
-)
+from cumplo_spotter.models.filter import compile_filters
 
 logger = getLogger(__name__)
 
@@ -44,41 +35,52 @@ def get_promising(user: User) -> list[FundingRequest]:
 
     """
     funding_requests = cumplo.get_available_funding_requests()
+    promising_requests = select(deduplicate(funding_requests), user.filters.values())
+    return sorted(promising_requests, key=lambda x: x.monthly_profit_rate, reverse=True)
 
-    promising_requests = set()
-    for configuration in user.filters.values():
-        promising_requests.update(filter_(funding_requests, configuration))
 
-    return sorted(promising_requests, key=lambda x: x.monthly_profit_rate, reverse=True)
+def deduplicate(funding_requests: Iterable[FundingRequest]) -> list[FundingRequest]:
+    """
+    Remove the repeated funding requests by their ID, keeping the first occurrence.
+
+    Args:
+        funding_requests (Iterable[FundingRequest]): Funding requests to deduplicate
+
+    Returns:
+        list[FundingRequest]: Unique funding requests
+
+    """
+    unique_funding_requests: dict[int, FundingRequest] = {}
+    for funding_request in funding_requests:
+        unique_funding_requests.setdefault(funding_request.id, funding_request)
+    return list(unique_funding_requests.values())
 
 
-def filter_(funding_requests: list[FundingRequest], configuration: FilterConfiguration) -> list[FundingRequest]:
+def select(
+    funding_requests: Sequence[FundingRequest], configurations: Iterable[FilterConfiguration]
+) -> list[FundingRequest]:
     """
-    Filter a list of funding requests based on the user's filter.
+    Select the funding requests that pass at least one of the user's filters.
 
     Args:
-        funding_requests (list[FundingRequest]): List of funding requests
-        configuration (FilterConfiguration): User's filter
+        funding_requests (Sequence[FundingRequest]): Funding requests to select from
+        configurations (Iterable[FilterConfiguration]): User's filters
 
     Returns:
-        list[FundingRequest]: Filtered funding requests
+        list[FundingRequest]: Selected funding requests
 
     """
-    filters = [
-        MinimumAmountFilter(configuration),
-        CreditTypeFilter(configuration),
-        MinimumInvestmentFilter(configuration),
-        MinimumScoreFilter(configuration),
-        MinimumIRRFilter(configuration),
-        MinimumMonthlyProfitFilter(configuration),
-        DicomFilter(configuration),
-        MinimumDurationFilter(configuration),
-        MaximumDurationFilter(configuration),
-        PortfolioFilter(configuration),
-    ]
-
-    logger.info(f"Applying {len(filters)} filters to {len(funding_requests)} funding requests")
-    funding_requests = list(filter(lambda x: all(f.apply(x) for f in filters), funding_requests))
-
-    logger.info(f"Got {len(funding_requests)} funding requests after applying filter {configuration.name}")
-    return funding_requests
+    selected = [False] * len(funding_requests)
+
+    for configuration in configurations:
+        filters = compile_filters(configuration)
+        logger.info(f"Applying {len(filters)} filters to {len(funding_requests)} funding requests")
+
+        for index, funding_request in enumerate(funding_requests):
+            # NOTE: Funding requests selected by a previous filter don't need to be checked again
+            if not selected[index]:
+                selected[index] = all(filter_.apply(funding_request) for filter_ in filters)
+
+        logger.info(f"Selected {sum(selected)} funding requests after applying filter {configuration.name}")
+
+    return list(compress(funding_requests, selected))
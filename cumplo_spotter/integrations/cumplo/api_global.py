@@ -1,4 +1,3 @@
-from decimal import Decimal
 from functools import cached_property
 from http import HTTPMethod
 from logging import getLogger
@@ -7,6 +6,7 @@ from typing import Any
 import requests
 from cumplo_common.models import Currency
 from pydantic import BaseModel, Field, field_validator
+from requests.adapters import HTTPAdapter
 from retry import retry
 
 from cumplo_spotter.models.cumplo.funding_request import CumploCreditType
@@ -16,6 +16,7 @@ from cumplo_spotter.utils.constants import (
     CUMPLO_GLOBAL_API_DETAILS,
     CUMPLO_GLOBAL_API_FUNDING_REQUESTS,
     CUMPLO_GLOBAL_API_SIMULATION,
+    CUMPLO_MAX_WORKERS,
     SIMULATION_AMOUNT,
 )
 
@@ -24,24 +25,24 @@ logger = getLogger(__name__)
 
 class GlobalFundingRequest(BaseModel):
     id: int = Field(...)
-    score: Decimal = Field(...)
-    irr: Decimal = Field(..., alias="tir")
+    score: float = Field(...)
+    irr: float = Field(..., alias="tir")
     currency: Currency = Field(..., alias="moneda")
     duration: CumploFundingRequestDuration = Field(..., alias="plazo")
-    raised_percentage: Decimal = Field(..., alias="porcentaje_inversion")
+    raised_percentage: float = Field(..., alias="porcentaje_inversion")
     credit_type: CumploCreditType = Field(...)
     id_borrower: int | None = Field(None)
 
     @field_validator("raised_percentage", mode="before")
     @classmethod
-    def raised_percentage_validator(cls, value: Any) -> Decimal:
-        """Validate that the raised percentage is a valid decimal number."""
-        return round(Decimal(int(value) / 100), 2)
+    def raised_percentage_validator(cls, value: Any) -> float:
+        """Validate that the raised percentage is a valid ratio."""
+        return round(int(value) / 100, 2)
 
     @cached_property
     def is_completed(self) -> bool:
         """Check if the funding request is fully funded."""
-        return self.raised_percentage == Decimal(1)
+        return self.raised_percentage == 1
 
 
 class CumploGlobalAPI:
@@ -49,6 +50,12 @@ class CumploGlobalAPI:
 
     url = CUMPLO_GLOBAL_API
 
+    # NOTE: The pool matches the number of workers fetching the funding request details concurrently. The session is
+    # shared across those threads, which is safe because these endpoints don't use cookies or authentication state
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_maxsize=CUMPLO_MAX_WORKERS))
+    session.mount("https://", HTTPAdapter(pool_maxsize=CUMPLO_MAX_WORKERS))
+
     @classmethod
     def _request(cls, method: HTTPMethod, endpoint: str, payload: dict | None = None) -> requests.Response:
         """
@@ -63,7 +70,7 @@ class CumploGlobalAPI:
             requests.Response: Response from the API
 
         """
-        return requests.request(method=method, url=f"{cls.url}{endpoint}", json=payload)
+        return cls.session.request(method=method, url=f"{cls.url}{endpoint}", json=payload)
 
     @classmethod
     @retry(requests.exceptions.JSONDecodeError, tries=5, delay=1)
@@ -104,7 +111,7 @@ class CumploGlobalAPI:
                 "id_operacion": funding_request.id,
                 "monto_simulacion": SIMULATION_AMOUNT,
                 "plazo": funding_request.duration.value,
-                "tasa_anual": float(funding_request.irr),
+                "tasa_anual": funding_request.irr,
                 "fecha_vencimiento": due_date,
             },
         }
@@ -14,6 +14,7 @@ class CumploGraphQLAPI:
 
     url = CUMPLO_GRAPHQL_API
     headers = CUMPLO_GRAPHQL_HEADERS
+    session = requests.Session()
 
     @classmethod
     def _request(cls, method: HTTPMethod, payload: dict | None = None) -> requests.Response:
@@ -28,7 +29,7 @@ class CumploGraphQLAPI:
             requests.Response: Response from the API
 
         """
-        return requests.request(method=method, url=cls.url, json=payload, headers=cls.headers)
+        return cls.session.request(method=method, url=cls.url, json=payload, headers=cls.headers)
 
     @classmethod
     @retry((KeyError, requests.exceptions.JSONDecodeError), tries=5, delay=1)
@@ -16,6 +16,7 @@ class CumploHTMLAPI:
     """Class to interact with Cumplo's HTML API."""
 
     url = CUMPLO_HTML_API
+    session = requests.Session()
 
     @classmethod
     def _request(cls, method: HTTPMethod, endpoint: str, payload: dict | None = None) -> requests.Response:
@@ -31,7 +32,7 @@ class CumploHTMLAPI:
             requests.Response: Response from the API
 
         """
-        return requests.request(method=method, url=f"{cls.url}{endpoint}", json=payload)
+        return cls.session.request(method=method, url=f"{cls.url}{endpoint}", json=payload)
 
     @classmethod
     def get_funding_requests(cls, id_funding_request: int) -> BeautifulSoup:
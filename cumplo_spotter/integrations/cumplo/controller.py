@@ -3,13 +3,15 @@ from logging import getLogger
 
 from cachetools import TTLCache, cached
 from cumplo_common.models import FundingRequest
+from pydantic import TypeAdapter
 
 from cumplo_spotter.integrations.cumplo.api_global import CumploGlobalAPI, GlobalFundingRequest
 from cumplo_spotter.models.cumplo import CumploFundingRequest
-from cumplo_spotter.utils.constants import CACHE_MAXSIZE, CUMPLO_CACHE_TTL
+from cumplo_spotter.utils.constants import CACHE_MAXSIZE, CUMPLO_CACHE_TTL, CUMPLO_MAX_WORKERS
 
 logger = getLogger(__name__)
 cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CUMPLO_CACHE_TTL)
+funding_requests_adapter = TypeAdapter(list[CumploFundingRequest])
 
 
 @cached(cache=cache)
@@ -23,11 +25,11 @@ def get_available_funding_requests() -> list[FundingRequest]:
     """
     logger.info("Getting funding requests from Cumplo API")
 
-    funding_requests = []
+    data = []
     global_funding_requests = CumploGlobalAPI.get_funding_requests(ignore_completed=True)
     logger.info(f"Found {len(global_funding_requests)} existing funding requests")
 
-    with ThreadPoolExecutor(max_workers=25) as executor:
+    with ThreadPoolExecutor(max_workers=CUMPLO_MAX_WORKERS) as executor:
         funding_request_by_future = {
             executor.submit(_get_funding_request_details, global_funding_request): global_funding_request
             for global_funding_request in global_funding_requests
@@ -36,12 +38,15 @@ def get_available_funding_requests() -> list[FundingRequest]:
             global_funding_request = funding_request_by_future[future]
             details, simulation = future.result()
 
-            data = {**details, **global_funding_request.model_dump(), "simulation": simulation}
-            funding_request = CumploFundingRequest.model_validate(data)
-            funding_request.borrower.id = global_funding_request.id_borrower
+            element = {**details, **global_funding_request.model_dump(), "simulation": simulation}
+            element["solicitante"]["id"] = global_funding_request.id_borrower
+            data.append(element)
 
-            if not funding_request.is_completed and funding_request.maximum_investment:
-                funding_requests.append(funding_request.export())
+    funding_requests = [
+        funding_request.export()
+        for funding_request in funding_requests_adapter.validate_python(data)
+        if not funding_request.is_completed and funding_request.maximum_investment
+    ]
 
     logger.info(f"Got {len(funding_requests)} funding requests")
     return funding_requests
@@ -1,6 +1,5 @@
-from decimal import Decimal
 from enum import StrEnum
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Any
 
 from cumplo_common.models import CreditType, Currency, FundingRequest
@@ -11,7 +10,7 @@ from cumplo_spotter.models.cumplo.borrower import Borrower
 from cumplo_spotter.models.cumplo.debtor import Debtor
 from cumplo_spotter.models.cumplo.request_duration import CumploFundingRequestDuration
 from cumplo_spotter.models.cumplo.simulation import CumploFundingRequestSimulation
-from cumplo_spotter.utils.constants import DicomMarker
+from cumplo_spotter.utils.constants import CACHE_MAXSIZE, DicomMarker
 
 
 class CumploCreditType(StrEnum):
@@ -48,11 +47,14 @@ CREDIT_TYPE_TRANSLATIONS = {
     CumploCreditType.ANTICIPO_SERVIU: CreditType.HUP_SUBSIDY,
 }
 
+# NOTE: Descriptions and document names repeat across funding requests of the same borrower
+cached_clean_text = lru_cache(maxsize=CACHE_MAXSIZE)(clean_text)
+
 
 class CumploFundingRequest(BaseModel):
     id: int = Field(..., alias="id_operacion")
-    score: Decimal = Field(...)
-    irr: Decimal = Field(..., alias="tir")
+    score: float = Field(...)
+    irr: float = Field(..., alias="tir")
     currency: Currency = Field(..., alias="moneda")
     amount: int = Field(..., alias="monto_financiar")
     credit_type: CreditType = Field(..., alias="codigo_producto")
@@ -60,7 +62,7 @@ class CumploFundingRequest(BaseModel):
     raised_amount: int = Field(..., alias="total_inversion")
     maximum_investment: int = Field(..., alias="max_inversion")
     investors: int = Field(..., alias="cantidad_inversionistas")
-    raised_percentage: Decimal = Field(..., alias="porcentaje_inversion")
+    raised_percentage: float = Field(..., alias="porcentaje_inversion")
 
     supporting_documents: list[str] = Field(default_factory=list, alias="tipo_respaldo")
     duration: CumploFundingRequestDuration = Field(..., alias="plazo")
@@ -87,8 +89,8 @@ class CumploFundingRequest(BaseModel):
     @staticmethod
     def _identify_dicom_status(data: dict) -> tuple[bool | None, bool | None]:
         """Identify the DICOM status of the borrower and debtors."""
-        debtor_description = clean_text(data["vitrina_descripcion_empresa_deudora"])
-        borrower_description = clean_text(data["vitrina_descripcion_empresa_solicitante"])
+        debtor_description = cached_clean_text(data["vitrina_descripcion_empresa_deudora"])
+        borrower_description = cached_clean_text(data["vitrina_descripcion_empresa_solicitante"])
         description = f"{borrower_description} {debtor_description}"
 
         debtor_dicom, borrower_dicom = None, None
@@ -120,13 +122,13 @@ class CumploFundingRequest(BaseModel):
     @classmethod
     def _format_supporting_documents(cls, value: Any) -> list[str]:
         """Format the supporting documents names."""
-        return [clean_text(document) for document in value]
+        return [cached_clean_text(document) for document in value]
 
     @field_validator("raised_percentage", mode="before")
     @classmethod
-    def raised_percentage_validator(cls, value: Any) -> Decimal:
-        """Validate that the raised percentage is a valid decimal number."""
-        return round(Decimal(int(value) / 100), 2)
+    def raised_percentage_validator(cls, value: Any) -> float:
+        """Validate that the raised percentage is a valid ratio."""
+        return round(int(value) / 100, 2)
 
     @field_validator("credit_type", mode="before")
     @classmethod
@@ -137,7 +139,7 @@ class CumploFundingRequest(BaseModel):
     @cached_property
     def is_completed(self) -> bool:
         """Check if the funding request is fully funded."""
-        return self.raised_percentage == Decimal(1)
+        return self.raised_percentage == 1
 
     def export(self) -> FundingRequest:
         """Export the CumploFundingRequest to a FundingRequest."""
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from logging import getLogger
-from typing import final
+from operator import attrgetter
+from typing import ClassVar, final
 
 from cumplo_common.models import FilterConfiguration, FundingRequest
 
@@ -9,10 +10,24 @@ from cumplo_spotter.models.cumplo.request_duration import DurationUnit
 logger = getLogger(__name__)
 
 
+def get_duration_in_days(funding_request: FundingRequest) -> int:
+    """Normalize the duration of the funding request to days."""
+    duration = funding_request.duration
+    return duration.value if duration.unit == DurationUnit.DAY else duration.value * 30
+
+
 class Filter(ABC):
+    # NOTE: Relative cost of applying the filter, cheaper filters are applied first so rejections short-circuit early
+    COST: ClassVar[int]
+
     def __init__(self, configuration: FilterConfiguration) -> None:
         self.configuration = configuration
 
+    @property
+    @abstractmethod
+    def is_enabled(self) -> bool:
+        """Check if the configuration enables the filter."""
+
     @abstractmethod
     def _apply(self, funding_request: FundingRequest) -> bool: ...
 
@@ -26,102 +41,132 @@ class Filter(ABC):
 
 
 class CreditTypeFilter(Filter):
+    COST = 0
+
+    @property
+    def is_enabled(self) -> bool:
+        """Check if the configuration sets the target credit types."""
+        return self.configuration.target_credit_types is not None
+
     def _apply(self, funding_request: FundingRequest) -> bool:
         """Filter out the funding requests that don't have the target credit types."""
-        if self.configuration.target_credit_types is None:
-            return True
-
         return funding_request.credit_type in self.configuration.target_credit_types
 
 
 class MinimumInvestmentFilter(Filter):
+    COST = 1
+
+    @property
+    def is_enabled(self) -> bool:
+        """Check if the configuration sets a minimum investment amount."""
+        return self.configuration.minimum_investment_amount is not None
+
     def _apply(self, funding_request: FundingRequest) -> bool:
         """Filter out the funding requests that have a available investment lower than the minimum."""
-        if self.configuration.minimum_investment_amount is None:
-            return True
-
         return funding_request.maximum_investment >= self.configuration.minimum_investment_amount
 
 
 class MinimumAmountFilter(Filter):
+    COST = 1
+
+    @property
+    def is_enabled(self) -> bool:
+        """Check if the configuration sets a minimum amount."""
+        return self.configuration.minimum_amount is not None
+
     def _apply(self, funding_request: FundingRequest) -> bool:
         """Filter out the funding requests that have a available investment lower than the minimum."""
-        if self.configuration.minimum_amount is None:
-            return True
-
         return funding_request.amount >= self.configuration.minimum_amount
 
 
 class MinimumScoreFilter(Filter):
+    COST = 1
+
+    @property
+    def is_enabled(self) -> bool:
+        """Check if the configuration sets a minimum score."""
+        return self.configuration.minimum_score is not None
+
     def _apply(self, funding_request: FundingRequest) -> bool:
         """Filter out the funding requests that have a score lower than the minimum."""
-        if self.configuration.minimum_score is None:
-            return True
-
         return funding_request.score >= self.configuration.minimum_score
 
 
 class MinimumMonthlyProfitFilter(Filter):
+    COST = 2
+
+    @property
+    def is_enabled(self) -> bool:
+        """Check if the configuration sets a minimum monthly profit rate."""
+        return self.configuration.minimum_monthly_profit_rate is not None
+
     def _apply(self, funding_request: FundingRequest) -> bool:
         """Filter out the funding requests that have a monthly profit lower than the minimum."""
-        if self.configuration.minimum_monthly_profit_rate is None:
-            return True
-
         return funding_request.monthly_profit_rate >= self.configuration.minimum_monthly_profit_rate
 
 
 class MinimumIRRFilter(Filter):
+    COST = 1
+
+    @property
+    def is_enabled(self) -> bool:
+        """Check if the configuration sets a minimum IRR."""
+        return self.configuration.minimum_irr is not None
+
     def _apply(self, funding_request: FundingRequest) -> bool:
         """Filter out the funding requests that have an IRR lower than the minimum."""
-        if self.configuration.minimum_irr is None:
-            return True
-
         return funding_request.irr >= self.configuration.minimum_irr
 
 
 class MinimumDurationFilter(Filter):
+    COST = 2
+
+    @property
+    def is_enabled(self) -> bool:
+        """Check if the configuration sets a minimum duration."""
+        return self.configuration.minimum_duration is not None
+
     def _apply(self, funding_request: FundingRequest) -> bool:
         """Filter out the funding requests that have a duration lower than the minimum."""
-        if self.configuration.minimum_duration is None:
-            return True
-
-        duration = (
-            funding_request.duration.value
-            if funding_request.duration.unit == DurationUnit.DAY
-            else funding_request.duration.value * 30
-        )
-        return duration >= self.configuration.minimum_duration
+        return get_duration_in_days(funding_request) >= self.configuration.minimum_duration
 
 
 class MaximumDurationFilter(Filter):
+    COST = 2
+
+    @property
+    def is_enabled(self) -> bool:
+        """Check if the configuration sets a maximum duration."""
+        return self.configuration.maximum_duration is not None
+
     def _apply(self, funding_request: FundingRequest) -> bool:
         """Filter out the funding requests that have a duration greater than the maximum."""
-        if self.configuration.maximum_duration is None:
-            return True
-
-        duration = (
-            funding_request.duration.value
-            if funding_request.duration.unit == DurationUnit.DAY
-            else funding_request.duration.value * 30
-        )
-        return duration <= self.configuration.maximum_duration
+        return get_duration_in_days(funding_request) <= self.configuration.maximum_duration
 
 
 class DicomFilter(Filter):
-    def _apply(self, funding_request: FundingRequest) -> bool:
-        """Filter out the funding requests whose debtor has DICOM."""
-        if self.configuration.ignore_dicom:
-            return True
+    COST = 3
+
+    @property
+    def is_enabled(self) -> bool:
+        """Check if the configuration requires funding requests without DICOM."""
+        return not self.configuration.ignore_dicom
 
+    def _apply(self, funding_request: FundingRequest) -> bool:  # noqa: PLR6301
+        """Filter out the funding requests whose debtor has DICOM."""
         dicoms = [debtor.dicom for debtor in funding_request.debtors] or [funding_request.borrower.dicom]
         return not any(dicoms)
 
 
 class PortfolioFilter(Filter):
-    def _apply(self, funding_request: FundingRequest) -> bool:
-        if not self.configuration.portfolio:
-            return True
+    COST = 4
 
+    @property
+    def is_enabled(self) -> bool:
+        """Check if the configuration sets portfolio thresholds."""
+        return bool(self.configuration.portfolio)
+
+    def _apply(self, funding_request: FundingRequest) -> bool:
         portfolios = [debtor.portfolio for debtor in funding_request.debtors] + [funding_request.borrower.portfolio]
 
         for portfolio in portfolios:
@@ -142,3 +187,23 @@ class PortfolioFilter(Filter):
                     return False
 
         return True
+
+
+FILTERS: tuple[type[Filter], ...] = (
+    MinimumAmountFilter,
+    CreditTypeFilter,
+    MinimumInvestmentFilter,
+    MinimumScoreFilter,
+    MinimumIRRFilter,
+    MinimumMonthlyProfitFilter,
+    DicomFilter,
+    MinimumDurationFilter,
+    MaximumDurationFilter,
+    PortfolioFilter,
+)
+
+
+def compile_filters(configuration: FilterConfiguration) -> list[Filter]:
+    """Build the filters enabled by the given configuration, sorted from cheapest to most expensive."""
+    filters = (filter_(configuration) for filter_ in FILTERS)
+    return sorted((filter_ for filter_ in filters if filter_.is_enabled), key=attrgetter("COST"))
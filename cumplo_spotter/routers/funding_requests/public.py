@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 from logging import getLogger
 from typing import cast
@@ -8,6 +9,7 @@ from fastapi import APIRouter
 from fastapi.requests import Request
 
 from cumplo_spotter.business import funding_requests
+from cumplo_spotter.utils.constants import PUBSUB_MAX_WORKERS
 
 logger = getLogger(__name__)
 
@@ -34,10 +36,13 @@ def _get_promising_funding_requests(request: Request) -> list[dict]:
 def _filter_funding_requests(request: Request, payload: list[FundingRequest]) -> None:
     """Filter a list of funding requests based on the user's filters."""
     user = cast(User, request.state.user)
-    promising_funding_requests = set() if user.filters else set(payload)
+    unique_funding_requests = funding_requests.deduplicate(payload)
 
-    for filter_ in user.filters.values():
-        promising_funding_requests.update(funding_requests.filter_(list(payload), filter_))
+    promising_funding_requests = (
+        funding_requests.select(unique_funding_requests, user.filters.values())
+        if user.filters
+        else unique_funding_requests
+    )
 
     if not promising_funding_requests:
         logger.info(f"No promising funding requests for user {user.id}")
@@ -45,6 +50,13 @@ def _filter_funding_requests(request: Request, payload: list[FundingRequest]) ->
 
     logger.info(f"Found {len(promising_funding_requests)} promising funding requests for user {user.id}")
 
-    for funding_request in promising_funding_requests:
-        logger.info(f"Notifying about funding request {funding_request.id} to user {user.id}")
-        CloudPubSub.publish(funding_request.json(), PrivateEvent.FUNDING_REQUEST_PROMISING, id_user=str(user.id))
+    id_user, topic = str(user.id), PrivateEvent.FUNDING_REQUEST_PROMISING
+    with ThreadPoolExecutor(max_workers=PUBSUB_MAX_WORKERS) as executor:
+        futures = []
+        for funding_request in promising_funding_requests:
+            logger.info(f"Notifying about funding request {funding_request.id} to user {user.id}")
+            futures.append(executor.submit(CloudPubSub.publish, funding_request.json(), topic, id_user=id_user))
+
+        # NOTE: Retrieving the results re-raises any error raised while publishing
+        for future in futures:
+            future.result()
@@ -55,11 +55,15 @@ CUMPLO_GLOBAL_API_DETAILS = os.getenv("CUMPLO_GLOBAL_API_DETAILS", "")
 UPFRONT_FEE_KEY = os.getenv("UPFRONT_FEE_KEY", "COMISION ENTRADA")
 EXIT_FEE_KEY = os.getenv("EXIT_FEE_KEY", "COMISION SALIDA")
 SIMULATION_AMOUNT = int(os.getenv("SIMULATION_AMOUNT", "1000000"))
+CUMPLO_MAX_WORKERS = int(os.getenv("CUMPLO_MAX_WORKERS", "25"))
 
 # Defaults
 DEFAULT_FILTER_NOTIFIED = bool(os.getenv("DEFAULT_FILTER_NOTIFIED"))
 DEFAULT_EXPIRATION_MINUTES = int(os.getenv("DEFAULT_EXPIRATION_MINUTES", "30"))
 
+# Pub/Sub
+PUBSUB_MAX_WORKERS = int(os.getenv("PUBSUB_MAX_WORKERS", "10"))
+
 # Cache
 CACHE_MAXSIZE = int(os.getenv("CACHE_MAXSIZE", "1000"))
 CUMPLO_CACHE_TTL = int(os.getenv("CUMPLO_CACHE_TTL", "120"))